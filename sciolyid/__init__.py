@@ -141,6 +141,11 @@ def setup(*args, **kwargs):
         config.options["verification_server"] = (
             config.options["verification_server"] or config.options["support_server"]
         )
+        if config.options["verification_server_id"]:
+            # discord returns ids as strings
+            config.options["verification_server_id"] = str(
+                config.options["verification_server_id"]
+            )
 
 
 def start():
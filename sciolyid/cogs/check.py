@@ -25,6 +25,7 @@ from sciolyid.data import (
     get_aliases,
     format_wiki_url,
     logger,
+    lowercase_possible_words,
     possible_words,
     prompts,
 )
@@ -74,7 +75,9 @@ class Check(commands.Cog):
                 correct = arg in correct_list
             else:
                 logger.info("spelling leniency")
-                correct = better_spellcheck(arg, correct_list, possible_words)
+                correct = better_spellcheck(
+                    arg, correct_list, lowercase_possible_words, lowercase_options=True
+                )
         else:
             logger.info("no race")
             if database.hget(f"session.data:{ctx.author.id}", "strict"):
@@ -82,7 +85,9 @@ class Check(commands.Cog):
                 correct = arg in correct_list
             else:
                 logger.info("spelling leniency")
-                correct = better_spellcheck(arg, correct_list, possible_words)
+                correct = better_spellcheck(
+                    arg, correct_list, lowercase_possible_words, lowercase_options=True
+                )
 
         if correct:
             logger.info("correct")
@@ -130,7 +135,10 @@ class Check(commands.Cog):
                     )
 
         elif len(prompts.get(current_item, [])) != 0 and better_spellcheck(
-            arg, prompts.get(current_item, []), possible_words
+            arg,
+            prompts.get(current_item, []),
+            lowercase_possible_words,
+            lowercase_options=True,
         ):
             logger.info("prompt")
             await ctx.send(
@@ -87,8 +87,9 @@ class Media(commands.Cog):
     @staticmethod
     def increment_item_frequency(ctx, item):
         item_setup(ctx, item)
-        database.zincrby("frequency.item:global", 1, string.capwords(item))
-        database.zincrby("frequency.item.refresh:global", 1, string.capwords(item))
+        item = string.capwords(item)
+        database.zincrby("frequency.item:global", 1, item)
+        database.zincrby("frequency.item.refresh:global", 1, item)
 
     async def send_pic(
         self,
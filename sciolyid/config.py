@@ -98,6 +98,7 @@ web_optional: Dict[str, Any] = {
     "discord_webhook_env": "DISCORD_WEBHOOK_URL",  # webhook url for discord notification log
     "discord_webhook_disable": [],  # types of webhooks to disable ("add", "verify", "valid", "error")
     "verification_server": None,  # invite to special discord server for people adding images, default to support server
+    "verification_server_id": None,  # id of the verification server, looked up from the invite if not set
     "disable_upload": False,  # disable user uploads
     "disable_validation": False,  # disable validation
     "validation_thresholds": {  # number of flags of each type to move the image on during validation
@@ -105,6 +106,7 @@ web_optional: Dict[str, Any] = {
         "duplicate": 3,
         "valid": 3,
     },
+    "file_threads": 8,  # number of threads used for filesystem operations when moving validated images
 }
 
 options: Dict[str, Any] = {
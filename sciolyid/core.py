@@ -16,6 +16,7 @@
 
 import asyncio
 import io
+import json
 import os
 from functools import partial
 from typing import Union
@@ -30,6 +31,9 @@ from sciolyid.util import black_and_white
 # Valid file types
 valid_image_extensions = {"jpg", "png", "jpeg", "gif"}
 
+# How long (seconds) to cache directory listings in redis
+FILES_CACHE_TTL = 60
+
 
 async def send_image(ctx, item: str, on_error=None, message=None, bw=False):
     """Gets a picture and sends it to the user.
@@ -111,30 +115,24 @@ async def get_image(ctx, item):
 
     images = await get_files(item)
     logger.info("images: " + str(images))
-    prevJ = int(database.hget(f"channel:{ctx.channel.id}", "prevJ").decode("utf-8"))
-    # Randomize start (choose beginning 4/5ths in case it fails checks)
+    # int() parses the bytes from redis directly, fall back to the setup default
+    prevJ = int(database.hget(f"channel:{ctx.channel.id}", "prevJ") or 20)
     if images:
-        j = (prevJ + 1) % len(images)
+        # check file type and size
+        valid_images = [
+            image
+            for image in images
+            if image[2] in valid_image_extensions
+            and image[1] < 4000000  # keep files less than 4mb
+        ]
+        logger.info(f"valid images: {len(valid_images)}")
+        if not valid_images:
+            raise GenericError("No Valid Images Found", code=999)
+
+        j = (prevJ + 1) % len(valid_images)
         logger.info("prevJ: " + str(prevJ))
         logger.info("j: " + str(j))
-
-        valid = False
-        for x in range(0, len(images)):  # check file type and size
-            y = (x + j) % len(images)
-            image_link = images[y]
-            extension = image_link.split(".")[-1]
-            logger.info("extension: " + str(extension))
-            stat_info = os.stat(image_link)
-            logger.info("size: " + str(stat_info.st_size))
-            if (
-                extension.lower() in valid_image_extensions
-                and stat_info.st_size < 4000000  # keep files less than 4mb
-            ):
-                logger.info("found one!")
-                valid = True
-                break
-        if not valid:
-            raise GenericError("No Valid Images Found", code=999)
+        image_link, _, extension = valid_images[j]
 
         database.hset(f"channel:{ctx.channel.id}", "prevJ", str(j))
     else:
@@ -143,8 +141,21 @@ async def get_image(ctx, item):
     return [image_link, extension]
 
 
+def _scan_files(directory: str) -> list:
+    """Returns (path, size, extension) tuples for files in `directory`."""
+    with os.scandir(directory) as it:
+        return [
+            (entry.path, entry.stat().st_size, entry.name.split(".")[-1].lower())
+            for entry in it
+            if entry.is_file()
+        ]
+
+
 async def get_files(item, retries=0):
-    """Returns a list of image/song filenames.
+    """Returns a list of image/song files.
+
+    Each entry is a tuple of (path, size in bytes, lowercase extension),
+    gathered in one pass with `os.scandir` so callers don't need to stat.
 
     This function also does cache management,
     looking for files in the cache for media and
@@ -157,15 +168,28 @@ async def get_files(item, retries=0):
     item = str(item).lower()
     category = get_category(item)
     directory = f"{config.options['download_dir']}{category}/{item}/"
+    cached = database.get(f"cache.files:{category}/{item}")
+    if cached is not None:
+        logger.info("using cached files")
+        return [tuple(entry) for entry in json.loads(cached)]
     try:
         logger.info("trying")
         logger.info(f"looking in: {directory}")
-        files_dir = os.listdir(directory)
+        # prevent the directory listing from blocking
+        loop = asyncio.get_running_loop()
+        files_dir = await loop.run_in_executor(None, partial(_scan_files, directory))
         if not files_dir:
             logger.info("no files in directory")
             raise GenericError("No Files", code=100)
         logger.info("files found!")
-        return [f"{directory}{path}" for path in sorted(files_dir)]
+        files_dir.sort()
+        pipe = database.pipeline()
+        pipe.setex(
+            f"cache.files:{category}/{item}", FILES_CACHE_TTL, json.dumps(files_dir)
+        )
+        pipe.sadd("cache.files", f"cache.files:{category}/{item}")
+        pipe.execute()
+        return files_dir
     except (FileNotFoundError, GenericError):
         # if not found, fetch images
         logger.info("fetching files")
@@ -142,6 +142,10 @@ if config.options["sentry"]:
 #     daily.incorrect:YYYY-MM-DD : [item name, # incorrect today]
 # }
 
+# media cache format:
+#   cache.files:category/item : json list of [path, size, extension], expires after 60s
+#   cache.files : { cache.files:category/item, ... } - cached keys to clear after syncing
+
 # ban format:
 #   banned:global : [user id, 0]
 
@@ -421,6 +425,9 @@ all_categories = set(
 possible_words = tuple(
     itertools.chain(master_id_list, *aliases.values(), *prompts.values())
 )  # item list that includes item aliases and prompt values
+lowercase_possible_words = tuple(
+    map(str.lower, possible_words)
+)  # lowercased once for spellchecking
 
 logger.info(f"List Lengths: {len(id_list)}")
 logger.info(f"Master List Lengths: {len(master_id_list)}")
@@ -10,7 +10,18 @@ async def channel_setup(ctx):
     `ctx` - Discord context object
     """
     logger.info("checking channel setup")
-    if not database.exists(f"channel:{ctx.channel.id}"):
+    pipe = database.pipeline()
+    pipe.exists(f"channel:{ctx.channel.id}")
+    pipe.zadd("score:global", {str(ctx.channel.id): 0}, nx=True)
+    if ctx.guild is not None:
+        channels = map(lambda x: str(x.id), ctx.guild.text_channels)
+        pipe.sadd(f"channels:{ctx.guild.id}", *channels)
+    channel_exists, score_added = pipe.execute()[:2]
+
+    if score_added:
+        logger.info("channel score added")
+
+    if not channel_exists:
         database.hset(
             f"channel:{ctx.channel.id}",
             mapping={"item": "", "answered": 1, "prevJ": 20, "prevI": ""},
@@ -19,14 +30,6 @@ async def channel_setup(ctx):
         logger.info("channel data added")
         await ctx.send("Ok, setup! I'm all ready to use!")
 
-    if database.zscore("score:global", str(ctx.channel.id)) is None:
-        database.zadd("score:global", {str(ctx.channel.id): 0})
-        logger.info("channel score added")
-
-    if ctx.guild is not None:
-        channels = map(lambda x: str(x.id), ctx.guild.text_channels)
-        database.sadd(f"channels:{ctx.guild.id}", *channels)
-
 
 async def user_setup(ctx):
     """Sets up a new discord user for score tracking.
@@ -34,35 +37,38 @@ async def user_setup(ctx):
     `ctx` - Discord context object
     """
     logger.info("checking user data")
-    if database.zscore("users:global", str(ctx.author.id)) is None:
-        database.zadd("users:global", {str(ctx.author.id): 0})
-        logger.info("user global added")
-        await ctx.send("Welcome <@" + str(ctx.author.id) + ">!")
-
     date = str(datetime.datetime.now(datetime.timezone.utc).date())
-    if database.zscore(f"daily.score:{date}", str(ctx.author.id)) is None:
-        database.zadd(f"daily.score:{date}", {str(ctx.author.id): 0})
-        logger.info("user daily added")
-
+    pipe = database.pipeline()
+    pipe.zadd("users:global", {str(ctx.author.id): 0}, nx=True)
+    pipe.zadd(f"daily.score:{date}", {str(ctx.author.id): 0}, nx=True)
     # Add streak
-    if (database.zscore("streak:global", str(ctx.author.id)) is None) or (
-        database.zscore("streak.max:global", str(ctx.author.id)) is None
-    ):
-        database.zadd("streak:global", {str(ctx.author.id): 0})
-        database.zadd("streak.max:global", {str(ctx.author.id): 0})
+    pipe.zadd("streak:global", {str(ctx.author.id): 0}, nx=True)
+    pipe.zadd("streak.max:global", {str(ctx.author.id): 0}, nx=True)
+    if ctx.guild is not None:
+        pipe.sadd(f"users.server.id:{ctx.guild.id}", str(ctx.author.id))
+        pipe.exists(f"users.server:{ctx.guild.id}")
+    results = pipe.execute()
+
+    if results[1]:
+        logger.info("user daily added")
+    if results[2] or results[3]:
         logger.info("added streak")
 
     if ctx.guild is not None:
-        if database.exists(f"users.server:{ctx.guild.id}"):
+        if results[-1]:
+            # migrate old server leaderboards
             users = map(
                 lambda x: x.decode("utf-8"),
                 database.zrange(f"users.server:{ctx.guild.id}", 0, -1),
             )
             database.sadd(f"users.server.id:{ctx.guild.id}", *users)
             database.delete(f"users.server:{ctx.guild.id}")
-        database.sadd(f"users.server.id:{ctx.guild.id}", str(ctx.author.id))
         logger.info("synced user to server")
 
+    if results[0]:
+        logger.info("user global added")
+        await ctx.send("Welcome <@" + str(ctx.author.id) + ">!")
+
 
 def item_setup(ctx, item: str):
     """Sets up a new item for incorrect tracking.
@@ -71,73 +77,35 @@ def item_setup(ctx, item: str):
     `item` - item to setup
     """
     logger.info("checking item data")
-    if database.zscore("incorrect:global", string.capwords(item)) is not None:
-        logger.info("item global ok")
-    else:
-        database.zadd("incorrect:global", {string.capwords(item): 0})
-        logger.info("item global added")
-
-    if (
-        database.zscore(f"incorrect.user:{ctx.author.id}", string.capwords(item))
-        is not None
-    ):
-        logger.info("incorrect item user ok")
-    else:
-        database.zadd(f"incorrect.user:{ctx.author.id}", {string.capwords(item): 0})
-        logger.info("incorrect item user added")
-
-    if (
-        database.zscore(f"correct.user:{ctx.author.id}", string.capwords(item))
-        is not None
-    ):
-        logger.info("correct item user ok")
-    else:
-        database.zadd(f"correct.user:{ctx.author.id}", {string.capwords(item): 0})
-        logger.info("correct item user added")
-
     date = str(datetime.datetime.now(datetime.timezone.utc).date())
-    if database.zscore(f"daily.incorrect:{date}", string.capwords(item)) is not None:
-        logger.info("item daily ok")
-    else:
-        database.zadd(f"daily.incorrect:{date}", {string.capwords(item): 0})
-        logger.info("item daily added")
-
-    if database.zscore("frequency.item:global", string.capwords(item)) is not None:
-        logger.info("item freq global ok")
-    else:
-        database.zadd("frequency.item:global", {string.capwords(item): 0})
-        logger.info("item freq global added")
-
+    keys = [
+        "incorrect:global",
+        f"incorrect.user:{ctx.author.id}",
+        f"correct.user:{ctx.author.id}",
+        f"daily.incorrect:{date}",
+        "frequency.item:global",
+    ]
     if ctx.guild is not None:
         logger.info("no dm")
-        if (
-            database.zscore(f"incorrect.server:{ctx.guild.id}", string.capwords(item))
-            is not None
-        ):
-            logger.info("item server ok")
-        else:
-            database.zadd(
-                f"incorrect.server:{ctx.guild.id}", {string.capwords(item): 0}
-            )
-            logger.info("item server added")
+        keys.append(f"incorrect.server:{ctx.guild.id}")
     else:
         logger.info("dm context")
 
-    if database.exists(f"session.data:{ctx.author.id}"):
+    session_active = database.exists(f"session.data:{ctx.author.id}")
+    if session_active:
         logger.info("session in session")
-        if (
-            database.zscore(f"session.incorrect:{ctx.author.id}", string.capwords(item))
-            is not None
-        ):
-            logger.info("item session ok")
-        else:
-            database.zadd(
-                f"session.incorrect:{ctx.author.id}", {string.capwords(item): 0}
-            )
-            logger.info("item session added")
+        keys.append(f"session.incorrect:{ctx.author.id}")
     else:
         logger.info("no session")
 
+    item = string.capwords(item)
+    pipe = database.pipeline()
+    for key in keys:
+        pipe.zadd(key, {item: 0}, nx=True)
+    for key, added in zip(keys, pipe.execute()):
+        if added:
+            logger.info(f"{key} item added")
+
 
 def session_increment(ctx, item: str, amount: int = 1):
     """Increments the value of a database hash field by `amount`.
@@ -166,23 +134,23 @@ def incorrect_increment(ctx, item: str, amount: int = 1):
     """
     logger.info(f"incrementing incorrect {item} by {amount}")
     date = str(datetime.datetime.now(datetime.timezone.utc).date())
-    database.zincrby("incorrect:global", amount, string.capwords(item))
-    database.zincrby(f"incorrect.user:{ctx.author.id}", amount, string.capwords(item))
-    database.zincrby(f"daily.incorrect:{date}", amount, string.capwords(item))
+    session_active = database.exists(f"session.data:{ctx.author.id}")
+    item = string.capwords(item)
+    pipe = database.pipeline()
+    pipe.zincrby("incorrect:global", amount, item)
+    pipe.zincrby(f"incorrect.user:{ctx.author.id}", amount, item)
+    pipe.zincrby(f"daily.incorrect:{date}", amount, item)
     if ctx.guild is not None:
         logger.info("no dm")
-        database.zincrby(
-            f"incorrect.server:{ctx.guild.id}", amount, string.capwords(item)
-        )
+        pipe.zincrby(f"incorrect.server:{ctx.guild.id}", amount, item)
     else:
         logger.info("dm context")
-    if database.exists(f"session.data:{ctx.author.id}"):
+    if session_active:
         logger.info("session in session")
-        database.zincrby(
-            f"session.incorrect:{ctx.author.id}", amount, string.capwords(item)
-        )
+        pipe.zincrby(f"session.incorrect:{ctx.author.id}", amount, item)
     else:
         logger.info("no session")
+    pipe.execute()
 
 
 def score_increment(ctx, amount: int = 1):
@@ -213,13 +181,11 @@ def streak_increment(ctx, amount: int):
 
     if amount is not None:
         # increment streak and update max
-        database.zincrby("streak:global", amount, ctx.author.id)
-        if database.zscore("streak:global", ctx.author.id) > database.zscore(
-            "streak.max:global", ctx.author.id
-        ):
-            database.zadd(
-                "streak.max:global",
-                {ctx.author.id: database.zscore("streak:global", ctx.author.id)},
-            )
+        pipe = database.pipeline()
+        pipe.zincrby("streak:global", amount, ctx.author.id)
+        pipe.zscore("streak.max:global", ctx.author.id)
+        streak, max_streak = pipe.execute()
+        if max_streak is None or streak > max_streak:
+            database.zadd("streak.max:global", {ctx.author.id: streak})
     else:
         database.zadd("streak:global", {ctx.author.id: 0})
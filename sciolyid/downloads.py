@@ -18,29 +18,44 @@ import asyncio
 import concurrent.futures
 import os
 import logging
+from typing import Dict
 
 import filelock
-from git import Repo
+from git import GitCommandError, Repo
 
 import sciolyid.config as config
 
 download_logger = logging.getLogger(config.options["name"] + ".git_downloads")
 
+# shared between syncs so concurrent requests don't each spin up threads
+_executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+
+# opening a Repo reads the git config and refs, so reuse them between syncs
+_repo_cache: Dict[str, Repo] = {}
+
 
 async def download_github(data, category, item):  # pylint: disable=unused-argument
     download_logger.info("syncing github")
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-        loop = asyncio.get_event_loop()
-        try:
-            os.listdir(config.options["download_dir"])
-        except FileNotFoundError:
-            download_logger.info("doesn't exist, cloning")
-            await loop.run_in_executor(executor, _clone)
-            download_logger.info("done cloning")
-        else:
-            download_logger.info("exists, syncing")
-            await loop.run_in_executor(executor, _sync)
-            download_logger.info("done syncing")
+    loop = asyncio.get_event_loop()
+    await loop.run_in_executor(_executor, _download)
+    await loop.run_in_executor(_executor, clear_files_cache, data.database)
+
+
+def clear_files_cache(database):
+    """Removes all cached directory listings after media changes."""
+    keys = database.smembers("cache.files")
+    database.delete("cache.files", *keys)
+
+
+def _download():
+    if not os.path.isdir(config.options["download_dir"]):
+        download_logger.info("doesn't exist, cloning")
+        _clone()
+        download_logger.info("done cloning")
+    else:
+        download_logger.info("exists, syncing")
+        _sync()
+        download_logger.info("done syncing")
 
 
 def _clone():
@@ -53,7 +68,20 @@ def _clone():
         )
 
 
+def _get_repo(path: str) -> Repo:
+    repo = _repo_cache.get(path)
+    if repo is None:
+        repo = _repo_cache[path] = Repo(path)
+    return repo
+
+
 def _sync():
-    downloads = Repo(config.options["download_dir"])
-    downloads.remote("origin").fetch()
-    downloads.head.reset(working_tree=True)
+    downloads = _get_repo(config.options["download_dir"])
+    # call git directly, we don't need GitPython to parse fetch info
+    downloads.git.fetch("origin")
+    # restore deleted files without dropping local commits that haven't been pushed
+    downloads.git.reset("HEAD", hard=True)
+    try:
+        downloads.git.merge("FETCH_HEAD", ff_only=True)
+    except GitCommandError:
+        download_logger.warning("local commits diverged from origin, not updating")
@@ -44,6 +44,9 @@ from sciolyid.data import (
 from sciolyid.data_functions import channel_setup
 from sciolyid.util import fetch_get_user
 
+# state role aliases don't change at runtime, so build the sets once
+state_role_aliases = {state: frozenset(states[state]["aliases"]) for state in states}
+
 
 def check_state_role(ctx) -> list:
     """Returns a list of state roles a user has.
@@ -56,10 +59,10 @@ def check_state_role(ctx) -> list:
     user_states = []
     if ctx.guild is not None:
         logger.info("server context")
-        user_role_names = [role.name.lower() for role in ctx.author.roles]
-        for state in states:
+        user_role_names = {role.name.lower() for role in ctx.author.roles}
+        for state, aliases in state_role_aliases.items():
             # gets similarities
-            if set(user_role_names).intersection(set(states[state]["aliases"])):
+            if not aliases.isdisjoint(user_role_names):
                 user_states.append(state)
     else:
         logger.info("dm context")
@@ -174,7 +177,11 @@ def backup_all():
     """
     logger.info("Starting Backup")
     logger.info("Creating Dump")
-    keys = (key.decode("utf-8") for key in database.keys())
+    keys = (
+        key.decode("utf-8")
+        for key in database.keys()
+        if not key.startswith(b"cache.")  # caches would never expire on restore
+    )
     dump = ((database.dump(key), key) for key in keys)
     logger.info("Finished Dump")
     logger.info("Writing To File")
@@ -240,6 +247,7 @@ async def evict_images():
         database.zadd("frequency.item.refresh:global", {item: 0})
         category = get_category(item)
         await config.options["evict_func"](sciolyid.data, category, item.lower())
+        database.delete(f"cache.files:{category}/{item.lower()}")
 
 
 class CustomCooldown:
@@ -16,7 +16,6 @@
 
 import difflib
 import functools
-import math
 import random
 from io import BytesIO
 from typing import Iterable, Optional
@@ -78,9 +77,12 @@ def black_and_white(input_image_path) -> BytesIO:
     `input_image_path` - path to image (string) or file object
     """
     with Image.open(input_image_path) as color_image:
+        # let the JPEG decoder output grayscale directly, no-op for other formats
+        color_image.draft("L", color_image.size)
         bw = color_image.convert("L")
         final_buffer = BytesIO()
-        bw.save(final_buffer, "png")
+        # images are sent right away, so favor encoding speed over size
+        bw.save(final_buffer, "png", compress_level=1)
     final_buffer.seek(0)
     return final_buffer
 
@@ -123,7 +125,7 @@ def spellcheck_list(
 ):
     for correct_word in correct_list:
         if abs_cutoff is None:
-            relative_cutoff = math.floor(len(correct_word) / 3)
+            relative_cutoff = len(correct_word) // 3
         else:
             relative_cutoff = abs_cutoff
         if spellcheck(word_to_check, correct_word, relative_cutoff):
@@ -139,23 +141,35 @@ def spellcheck(worda: str, wordb: str, cutoff: int = 3) -> bool:
     """
     worda = worda.lower().replace("-", " ").replace("'", "")
     wordb = wordb.lower().replace("-", " ").replace("'", "")
-    shorterword = min(worda, wordb, key=len)
-    if worda != wordb:
-        if (
-            len(tuple(difflib.Differ().compare(worda, wordb))) - len(shorterword)
-            > cutoff
-        ):
-            return False
-    return True
+    if worda == wordb:
+        return True
+    longer = max(len(worda), len(wordb))
+    # the difference can't be less than the difference in length
+    if longer - min(len(worda), len(wordb)) > cutoff:
+        return False
+    # same count as the lines from difflib.Differ().compare minus the shorter length,
+    # without building the full diff
+    matched = sum(
+        block.size
+        for block in difflib.SequenceMatcher(None, worda, wordb).get_matching_blocks()
+    )
+    return longer - matched <= cutoff
 
 
 def better_spellcheck(
-    word: str, correct: Iterable[str], options: Iterable[str]
+    word: str,
+    correct: Iterable[str],
+    options: Iterable[str],
+    lowercase_options: bool = False,
 ) -> bool:
-    """Allow lenient spelling unless another answer is closer."""
-    matches = difflib.get_close_matches(
-        word.lower(), map(str.lower, options), n=1, cutoff=(2 / 3)
-    )
+    """Allow lenient spelling unless another answer is closer.
+
+    Pass `lowercase_options=True` to skip lowercasing `options`
+    when they are already lowercase (e.g. `lowercase_possible_words`).
+    """
+    if not lowercase_options:
+        options = map(str.lower, options)
+    matches = difflib.get_close_matches(word.lower(), options, n=1, cutoff=(2 / 3))
     if not matches:
         return False
     if matches[0] in map(str.lower, correct):
@@ -79,7 +79,8 @@ def send_image(image_id: str):
         os.path.abspath(
             config.options["validation_local_dir"]
             + config.options["validation_repo_dir"]
-        )
+        ),
+        (image_id,),
     )
     image_path = lookup.get(image_id, None)
     if not image_path:
@@ -96,13 +97,14 @@ def confirm():
     if confirmation not in ("valid", "invalid", "duplicate"):
         abort(400, "invalid confirmation field")
 
+    image_id = request.form["id"]
     lookup = filename_lookup(
         os.path.abspath(
             config.options["validation_local_dir"]
             + config.options["validation_repo_dir"]
-        )
+        ),
+        (image_id,),
     )
-    image_id = request.form["id"]
     if image_id not in lookup.keys():
         abort(400, "invalid id")
 
@@ -125,7 +127,8 @@ def stats():
         os.path.abspath(
             config.options["validation_local_dir"]
             + config.options["validation_repo_dir"]
-        )
+        ),
+        (image_id,),
     )
     if image_id not in lookup.keys():
         abort(400, "invalid id")
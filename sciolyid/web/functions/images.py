@@ -14,10 +14,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import concurrent.futures
 import csv
 import imghdr
 import os
-from typing import Dict, Optional, Set, Union
+from typing import Dict, Iterable, Optional, Set, Union
 
 import imagehash
 import requests
@@ -30,6 +31,7 @@ from sciolyid.web.config import logger
 VALID_MIMETYPES = ("image/jpeg", "image/png")
 VALID_IMG_TYPES = ("jpeg", "png")
 MAX_FILESIZE = 4000000  # 4 mb
+MAX_INLINE_CHECKS = 4  # check this many images without starting a thread pool
 
 
 def find_duplicates(image, distance: int = 5, ignore_verify: bool = False) -> list:
@@ -93,26 +95,63 @@ def generate_id_lookup(ignore_verify: bool = False) -> Optional[Dict[str, str]]:
     return lookup
 
 
-def filename_lookup(start_path: str) -> dict:
+def filename_lookup(start_path: str, image_ids: Optional[Iterable[str]] = None) -> dict:
+    """Maps image ids to the paths of valid images in `start_path`.
+
+    If `image_ids` is passed, only those ids are resolved, which avoids
+    walking the whole directory tree.
+    """
     id_lookup = generate_id_lookup()
     if not id_lookup:
         abort(404, "filename lookup failed!")
     result = {}
-    stack = []
-    stack.append(start_path)
-    while stack:
-        current = stack.pop()
-        for child_filename in os.listdir(current):
-            if child_filename.startswith("."):
+    candidates = []
+    if image_ids is not None:
+        wanted = set(image_ids)
+        root = os.path.abspath(start_path)
+        for filename, image_id in id_lookup.items():
+            if image_id not in wanted:
                 continue
-            child_path = os.path.join(current, child_filename)
-            if os.path.isdir(child_path):
-                stack.append(child_path)
+            child_path = os.path.normpath(os.path.join(root, filename))
+            # match the walk below: stay inside start_path and skip hidden paths
+            if os.path.commonpath((root, child_path)) != root or any(
+                part.startswith(".")
+                for part in os.path.relpath(child_path, root).split(os.sep)
+            ):
                 continue
-            if imghdr.what(child_path) in VALID_IMG_TYPES:
-                image_id = id_lookup.get("./" + os.path.relpath(child_path, start_path))
-                if image_id:
-                    result[image_id] = child_path
+            if os.path.isfile(child_path):
+                candidates.append((image_id, child_path))
+    else:
+        stack = []
+        stack.append(start_path)
+        while stack:
+            current = stack.pop()
+            with os.scandir(current) as it:
+                for child in it:
+                    if child.name.startswith("."):
+                        continue
+                    if child.is_dir():
+                        stack.append(child.path)
+                        continue
+                    image_id = id_lookup.get(
+                        "./" + os.path.relpath(child.path, start_path)
+                    )
+                    if image_id:
+                        candidates.append((image_id, child.path))
+
+    if len(candidates) <= MAX_INLINE_CHECKS:
+        image_types = [imghdr.what(path) for _, path in candidates]
+    else:
+        # reading image headers is latency bound, so check them concurrently
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=config.options["file_threads"]
+        ) as executor:
+            image_types = list(
+                executor.map(imghdr.what, [path for _, path in candidates])
+            )
+    for (image_id, child_path), image_type in zip(candidates, image_types):
+        if image_type in VALID_IMG_TYPES:
+            result[image_id] = child_path
     logger.info(f"found {len(result)} files")
     return result
 
@@ -62,9 +62,9 @@ def fetch_profile(user_id: Union[int, str]) -> Dict[str, str]:
     return profile
 
 
-def fetch_server_id():
-    if config.options.get("verification_server_id", None):
-        return config.options.get("verification_server_id")
+def fetch_server_id() -> str:
+    if config.options["verification_server_id"]:
+        return config.options["verification_server_id"]
     url = INVITE_TO_ID_URL.format(
         code=config.options["verification_server"].split("/")[-1]
     )
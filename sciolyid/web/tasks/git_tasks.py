@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import concurrent.futures
+import contextlib
 import json
 import os
 import random
@@ -32,31 +34,34 @@ from sciolyid.web.tasks import celery_app, database
 
 logger = get_task_logger(__name__)
 
+# (bitmask, name) pairs for decoding flags without string formatting
 GIT_PUSHINFO_FLAGS = (
-    "ERROR",  # 1024
-    "UP_TO_DATE",  # 512
-    "FAST_FORWARD",  # 256
-    "FORCED_UPDATE",  # 128
-    "DELETED",  # 64
-    "REMOTE_FAILURE",  # 32
-    "REMOTE_REJECTED",  # 16
-    "REJECTED",  # 8
-    "NO_MATCH",  # 4
-    "NEW_HEAD",  # 2
-    "NEW_TAG",  # 1
+    (1024, "ERROR"),
+    (512, "UP_TO_DATE"),
+    (256, "FAST_FORWARD"),
+    (128, "FORCED_UPDATE"),
+    (64, "DELETED"),
+    (32, "REMOTE_FAILURE"),
+    (16, "REMOTE_REJECTED"),
+    (8, "REJECTED"),
+    (4, "NO_MATCH"),
+    (2, "NEW_HEAD"),
+    (1, "NEW_TAG"),
 )
 GIT_PUSH_OPCODES = (
-    "CHECKING_OUT",  # 256
-    "FINDING_SOURCES",  # 128
-    "RESOLVING",  # 64
-    "RECEIVING",  # 32
-    "WRITING",  # 16
-    "COMPRESSING",  # 8
-    "COUNTING",  # 4
-    "END",  # 2
-    "BEGIN",  # 1
+    (256, "CHECKING_OUT"),
+    (128, "FINDING_SOURCES"),
+    (64, "RESOLVING"),
+    (32, "RECEIVING"),
+    (16, "WRITING"),
+    (8, "COMPRESSING"),
+    (4, "COUNTING"),
+    (2, "END"),
+    (1, "BEGIN"),
 )
 
+PROGRESS_UPDATE_INTERVAL = 0.1  # minimum seconds between progress writes
+
 VALID_THRESH = config.options["validation_thresholds"]["valid"]
 DUPLICATE_THRESH = config.options["validation_thresholds"]["duplicate"]
 INVALID_THRESH = config.options["validation_thresholds"]["invalid"]
@@ -72,10 +77,9 @@ def _push_helper(repo, commit_message, progress=None):
     push_result = repo.remote("origin").push(progress=progress)
     if len(push_result) == 0:
         return (None, commit)
-    set_flags = []
-    for i, flag in enumerate(f"{push_result[0].flags:0>11b}"):
-        if int(flag):
-            set_flags.append(GIT_PUSHINFO_FLAGS[i])
+    set_flags = [
+        name for mask, name in GIT_PUSHINFO_FLAGS if push_result[0].flags & mask
+    ]
     logger.info(set_flags)
     return (set_flags, commit, push_result[0])
 
@@ -108,13 +112,17 @@ def gen_progress(user_id: Union[int, str]) -> Callable:
     if isinstance(user_id, int):
         user_id = str(user_id)
 
+    last_update = 0.0
+
     def wrapped_progress(op_code, cur_count, max_count=None, message=""):
-        nonlocal user_id
-        readable_opcode = {
-            GIT_PUSH_OPCODES[i] if int(code) else None
-            for i, code in enumerate(f"{op_code:0>9b}")
-        }
-        readable_opcode.discard(None)
+        nonlocal user_id, last_update
+        readable_opcode = {name for mask, name in GIT_PUSH_OPCODES if op_code & mask}
+        stage_change = "BEGIN" in readable_opcode or "END" in readable_opcode
+        now = time.monotonic()
+        if not stage_change and now - last_update < PROGRESS_UPDATE_INTERVAL:
+            # skip intermediate updates to avoid a redis write every tick
+            return
+        last_update = now
         data = {
             "op_code": json.dumps(list(readable_opcode)),
             "cur_count": json.dumps(cur_count),
@@ -122,17 +130,34 @@ def gen_progress(user_id: Union[int, str]) -> Callable:
             "message": json.dumps(message),
         }
         database.hset(f"sciolyid.upload.status:{user_id}", mapping=data)
-        if (
-            random.randint(1, 4) == 1  # 25%
-            or "BEGIN" in readable_opcode
-            or "END" in readable_opcode
-        ):
+        if random.randint(1, 4) == 1 or stage_change:  # 25%
             # only log occasionally
             logger.info(data)
 
     return wrapped_progress
 
 
+def _copy_file(path, destination):
+    """Copies a file, creating the destination directory for new items."""
+    # git doesn't track empty directories, so the item folder may not exist yet
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    # copyfile skips copying permissions and uses sendfile on linux
+    shutil.copyfile(path, destination)
+
+
+def _unlink(path):
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+
+
+def _remove_files(repo, paths, executor):
+    """Removes files from the index in one call, then deletes them concurrently."""
+    # unstage first, so a failed unlink only leaves an untracked file
+    # that the next run can unstage (ignoring it) and delete again
+    repo.index.remove(paths, ignore_unmatch=True)
+    list(executor.map(_unlink, paths))  # raise any errors from deleting
+
+
 @celery_app.task
 def move_images():
     logger.info("checking for move")
@@ -143,50 +168,83 @@ def move_images():
     root = os.path.abspath(
         config.options["validation_local_dir"] + config.options["validation_repo_dir"]
     )
-    lookup = filename_lookup(root)
-    delete = set(
-        map(
-            lambda x: x.decode("utf-8"),
-            database.zrangebyscore(
-                "sciolyid.verify.images:invalid", INVALID_THRESH, "+inf"
-            )
-            + database.zrangebyscore(
-                "sciolyid.verify.images:duplicate", DUPLICATE_THRESH, "+inf"
-            ),
-        )
-    )
-    if delete:
-        database.zremrangebyscore(
-            "sciolyid.verify.images:invalid", INVALID_THRESH, "+inf"
-        )
-        database.zremrangebyscore(
-            "sciolyid.verify.images:duplicate", DUPLICATE_THRESH, "+inf"
-        )
-        for image in delete:
-            verify_repo.index.remove(lookup[image], working_tree=True)
-
-    valid = set(
-        map(
-            lambda x: x.decode("utf-8"),
-            database.zrangebyscore(
-                "sciolyid.verify.images:valid", VALID_THRESH, "+inf"
-            ),
-        )
+    # read the flagged images in one round trip
+    pipe = database.pipeline()
+    pipe.zrangebyscore("sciolyid.verify.images:invalid", INVALID_THRESH, "+inf")
+    pipe.zrangebyscore("sciolyid.verify.images:duplicate", DUPLICATE_THRESH, "+inf")
+    pipe.zrangebyscore("sciolyid.verify.images:valid", VALID_THRESH, "+inf")
+    invalid, duplicate, valid = (
+        set(map(lambda x: x.decode("utf-8"), members)) for members in pipe.execute()
     )
+
+    lookup = {}
+    missing = set()
+    if invalid or duplicate or valid:
+        # fetch failures abort here, before any votes are cleared
+        lookup = filename_lookup(root, invalid | duplicate | valid)
+        missing = (invalid | duplicate | valid) - lookup.keys()
+        if missing:
+            # not in ids.csv or not a valid image on disk anymore, so these
+            # will never resolve and their votes are cleared below
+            logger.info(f"images not found: {missing}")
+            invalid -= missing
+            duplicate -= missing
+            valid -= missing
+    delete = invalid | duplicate
+
     added_items = []
-    if valid:
-        database.zremrangebyscore("sciolyid.verify.images:valid", VALID_THRESH, "+inf")
-        for image in valid:
-            if image in delete:
-                continue
-            path = lookup[image]
-            item = os.path.dirname(os.path.relpath(path, root))
-            added_items.append(item)
-            category = get_category(item)
-            shutil.copy(
-                path, os.path.join(image_repo.working_tree_dir, category, item, "")
-            )
-            verify_repo.index.remove(path, working_tree=True)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=config.options["file_threads"]
+    ) as executor:
+        if delete:
+            _remove_files(verify_repo, [lookup[image] for image in delete], executor)
+
+        if valid:
+            moved = []
+            copies = {}
+            for image in valid:
+                if image in delete:
+                    continue
+                path = lookup[image]
+                item = os.path.dirname(os.path.relpath(path, root))
+                category = get_category(item)
+                destination = os.path.join(
+                    image_repo.working_tree_dir,
+                    category,
+                    item,
+                    os.path.basename(path),
+                )
+                future = executor.submit(_copy_file, path, destination)
+                copies[future] = (image, path, item, destination)
+
+            failed = set()
+            for future in concurrent.futures.as_completed(copies):
+                image, path, item, destination = copies[future]
+                try:
+                    future.result()
+                except OSError as e:
+                    # keep the votes for this image and move on with the rest
+                    logger.error(f"failed to copy {image}: {e}")
+                    failed.add(image)
+                    with contextlib.suppress(FileNotFoundError):
+                        os.remove(destination)  # don't commit a partial copy
+                    continue
+                moved.append(path)
+                added_items.append(item)
+            valid -= failed
+            if moved:
+                _remove_files(verify_repo, moved, executor)
+
+    # clear only the votes that were read and handled above
+    pipe = database.pipeline()
+    for key, members in (
+        ("invalid", invalid | missing),
+        ("duplicate", duplicate | missing),
+        ("valid", valid | missing),
+    ):
+        if members:
+            pipe.zrem(f"sciolyid.verify.images:{key}", *members)
+    pipe.execute()
 
     if valid or delete:
         verify_push = _push_helper(verify_repo, "Update through verification!")